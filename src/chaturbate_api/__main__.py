@@ -1,14 +1,18 @@
 """Entry point for the Chaturbate API client."""
 
+import argparse
 import asyncio
 import logging
 import sys
+from contextlib import AsyncExitStack
 
 import aiohttp
 
 from chaturbate_api.client import ChaturbateAPIClient
 from chaturbate_api.config import Config
 from chaturbate_api.event_handlers import event_handlers
+from chaturbate_api.supervisor import Supervisor
+from chaturbate_api.webhook import WebhookDelivery
 
 # Configure logging
 logging.basicConfig(
@@ -16,8 +20,8 @@ logging.basicConfig(
     format="%(message)s",
 )
 
-# Get the base URL of the events API
-EVENTS_API_URL = Config.get_url()
+# Get the URL that events are forwarded to, if configured
+WEBHOOK_URL = Config.get_webhook_url()
 
 
 async def main() -> None:
@@ -28,14 +32,22 @@ async def main() -> None:
         None
 
     """
-    # Initialize aiohttp session
-    async with aiohttp.ClientSession() as session:
+    async with AsyncExitStack() as stack:
+        # Initialize aiohttp session
+        session = await stack.enter_async_context(aiohttp.ClientSession())
+
+        # Start outbound webhook delivery if a webhook URL is configured
+        webhook = None
+        if WEBHOOK_URL:
+            webhook = await stack.enter_async_context(WebhookDelivery(WEBHOOK_URL))
+
         # Initialize the Chaturbate API client with the base URL,
-        # session, and event handlers
+        # session, event handlers, and webhook delivery stage
         client = ChaturbateAPIClient(
-            base_url=EVENTS_API_URL,
+            base_url=Config.get_url(),
             session=session,
             event_handlers=event_handlers,
+            webhook=webhook,
         )
 
         try:
@@ -46,9 +58,51 @@ async def main() -> None:
             sys.exit(1)
 
 
+def supervise(workers: int) -> None:
+    """Run the supervisor that shards rooms across worker processes.
+
+    Args:
+    ----
+        workers (int): The number of worker processes.
+
+    Returns:
+    -------
+        None
+
+    """
+    try:
+        Supervisor(Config.get_urls(), workers, WEBHOOK_URL).run()
+    except Exception:
+        logging.exception("An error occurred")
+        sys.exit(1)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments.
+
+    Returns
+    -------
+        argparse.Namespace: The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(prog="chaturbate_api")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Shard the rooms in EVENTS_API_URLS across this many processes",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    # Run the main coroutine
+    args = parse_args()
     try:
-        asyncio.run(main())
+        if args.workers > 0:
+            # Supervise worker processes that each run a share of the rooms
+            supervise(args.workers)
+        else:
+            # Run the main coroutine
+            asyncio.run(main())
     except KeyboardInterrupt:
         sys.exit(0)
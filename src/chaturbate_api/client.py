@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from aiolimiter import AsyncLimiter
@@ -13,14 +15,23 @@ from chaturbate_api.exceptions import ChaturbateServerError
 from .constants import (
     API_REQUEST_LIMIT,
     API_REQUEST_PERIOD,
+    HANDLER_LANE_SIZE,
+    HANDLER_LATENCY_BUDGET,
+    HANDLER_QUARANTINE_THRESHOLD,
+    HANDLER_RECOVERY_THRESHOLD,
+    HANDLER_TIMEOUT,
     HTTP_CLIENT_ERROR,
     HTTP_SERVER_ERROR,
     HTTP_SUCCESS,
 )
+from .handler_stats import HandlerStats
 
 if TYPE_CHECKING:
     import aiohttp
 
+    from .rate_limiter import SharedRateLimiter
+    from .webhook import WebhookDelivery
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,14 +46,23 @@ class ChaturbateAPIClient:
         base_url (str): The base URL for the API.
         session (aiohttp.ClientSession): The aiohttp client session.
         event_handlers (Dict[str, Any]): A dictionary of event handlers.
+        handler_timeouts (Dict[str, float]): Per-method handler timeouts.
+        latency_budgets (Dict[str, float]): Per-method handler latency budgets.
+        handler_stats (Dict[str, HandlerStats]): Per-method handler statistics.
+        webhook (WebhookDelivery): Optional outbound webhook delivery stage.
+        limiter (AsyncLimiter | SharedRateLimiter): The API request rate limiter.
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917
         self: ChaturbateAPIClient,
         base_url: str,
         session: aiohttp.ClientSession,
         event_handlers: dict[str, Any],
+        handler_timeouts: dict[str, float] | None = None,
+        latency_budgets: dict[str, float] | None = None,
+        webhook: WebhookDelivery | None = None,
+        limiter: AsyncLimiter | SharedRateLimiter | None = None,
     ) -> None:
         """Initialize the Chaturbate API client.
 
@@ -51,12 +71,27 @@ class ChaturbateAPIClient:
             base_url (str): The base URL for the API.
             session (aiohttp.ClientSession): The aiohttp client session.
             event_handlers (Dict[str, Any]): A dictionary of event handlers.
+            handler_timeouts (Dict[str, float], optional): Timeouts in seconds
+                keyed by event method. Defaults to HANDLER_TIMEOUT.
+            latency_budgets (Dict[str, float], optional): Latency budgets in
+                seconds keyed by event method. Defaults to HANDLER_LATENCY_BUDGET.
+            webhook (WebhookDelivery, optional): Delivery stage that events
+                are forwarded to.
+            limiter (AsyncLimiter | SharedRateLimiter, optional): Rate limiter
+                for API requests, e.g. one shared with other processes.
+                Defaults to a new limiter for API_REQUEST_LIMIT requests per
+                API_REQUEST_PERIOD.
 
         """
         self.base_url = base_url
         self.session = session
         self.event_handlers = event_handlers
-        self.limiter = AsyncLimiter(API_REQUEST_LIMIT, API_REQUEST_PERIOD)
+        self.handler_timeouts = handler_timeouts or {}
+        self.latency_budgets = latency_budgets or {}
+        self.handler_stats: dict[str, HandlerStats] = {}
+        self.webhook = webhook
+        self.limiter = limiter or AsyncLimiter(API_REQUEST_LIMIT, API_REQUEST_PERIOD)
+        self._lanes: dict[str, tuple[asyncio.Queue, asyncio.Task]] = {}
 
     async def run(self: ChaturbateAPIClient) -> None:
         """Start the client and continuously retrieve events from the API."""
@@ -64,12 +99,18 @@ class ChaturbateAPIClient:
 
         url = self.base_url
 
-        while url:
-            events, next_url = await self.get_events(
-                url,
-            )  # Adjust get_events to return next_url
-            await self.process_events(events)
-            url = next_url  # Update the URL for the next iteration
+        try:
+            while url:
+                events, next_url = await self.get_events(
+                    url,
+                )  # Adjust get_events to return next_url
+                await self.process_events(events)
+                url = next_url  # Update the URL for the next iteration
+        except BaseException:
+            # Don't wait on slow handlers when cancelled or failing
+            await self.cancel_lanes()
+            raise
+        await self.close_lanes()
 
     async def get_events(
         self: ChaturbateAPIClient,
@@ -153,8 +194,159 @@ class ChaturbateAPIClient:
         formatted_obj = json.dumps(obj, indent=4)
 
         logger.debug("Method: %s\nObject: %s", method, formatted_obj)
-        if handler_class:
-            handler = handler_class()
-            await handler.handle(event)
-        else:
+        if self.webhook:
+            self.webhook.submit(event)
+        if not handler_class:
             logger.warning("Unknown method: %s", method)
+            return
+
+        stats = self.handler_stats.setdefault(method, HandlerStats())
+        if stats.quarantined or method in self._lanes:
+            # Slow handlers run in a background lane so they don't stall polling
+            self.submit_to_lane(method, handler_class, event)
+        else:
+            await self.run_handler(handler_class, event)
+
+    def submit_to_lane(
+        self: ChaturbateAPIClient,
+        method: str,
+        handler_class: Any,  # noqa: ANN401
+        event: dict[str, Any],
+    ) -> None:
+        """Queue an event on the background lane of its method.
+
+        Each lane runs its handler one event at a time, in order. Events are
+        dropped when the lane already holds HANDLER_LANE_SIZE events.
+
+        Args:
+        ----
+            method (str): The event method.
+            handler_class (Any): The handler class for the event.
+            event (Dict[str, Any]): The event to handle.
+
+        """
+        if method not in self._lanes:
+            lane: asyncio.Queue = asyncio.Queue(HANDLER_LANE_SIZE)
+            task = asyncio.create_task(self._run_lane(method, handler_class, lane))
+            self._lanes[method] = (lane, task)
+        lane = self._lanes[method][0]
+        try:
+            lane.put_nowait(event)
+        except asyncio.QueueFull:
+            self.handler_stats[method].dropped += 1
+            logger.warning("Background lane for %s full, dropping event", method)
+
+    async def _run_lane(
+        self: ChaturbateAPIClient,
+        method: str,
+        handler_class: Any,  # noqa: ANN401
+        lane: asyncio.Queue,
+    ) -> None:
+        """Handle queued events until the lane is empty and the handler recovered.
+
+        Args:
+        ----
+            method (str): The event method.
+            handler_class (Any): The handler class for the event.
+            lane (asyncio.Queue): The queued events.
+
+        """
+        stats = self.handler_stats[method]
+        while True:
+            event = await lane.get()
+            try:
+                await self.run_handler(handler_class, event)
+            finally:
+                lane.task_done()
+            if lane.empty() and not stats.quarantined:
+                break
+        self._lanes.pop(method, None)
+
+    async def close_lanes(self: ChaturbateAPIClient) -> None:
+        """Wait for the background lanes to finish their queued events."""
+        lanes = list(self._lanes.values())
+        for lane, _ in lanes:
+            await lane.join()
+        for _, task in lanes:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in lanes), return_exceptions=True)
+        self._lanes.clear()
+
+    async def cancel_lanes(self: ChaturbateAPIClient) -> None:
+        """Cancel the background lanes, dropping their queued events."""
+        lanes = list(self._lanes.items())
+        self._lanes.clear()
+        for method, (lane, task) in lanes:
+            if lane.qsize():
+                self.handler_stats[method].dropped += lane.qsize()
+                logger.warning(
+                    "Dropping %s queued events for %s",
+                    lane.qsize(),
+                    method,
+                )
+            task.cancel()
+        await asyncio.gather(*(task for _, (_, task) in lanes), return_exceptions=True)
+
+    async def run_handler(
+        self: ChaturbateAPIClient,
+        handler_class: Any,  # noqa: ANN401
+        event: dict[str, Any],
+    ) -> None:
+        """Run an event handler with a timeout and record its latency.
+
+        Exceptions raised by the handler are logged rather than propagated,
+        so a failing handler does not stop the client. A handler that exceeds
+        its latency budget HANDLER_QUARANTINE_THRESHOLD times in a row is
+        quarantined and subsequently run in a background lane, until it stays
+        within budget HANDLER_RECOVERY_THRESHOLD times in a row.
+
+        Args:
+        ----
+            handler_class (Any): The handler class for the event.
+            event (Dict[str, Any]): The event to handle.
+
+        Returns:
+        -------
+            None
+
+        """
+        method = event.get("method")
+        stats = self.handler_stats.setdefault(method, HandlerStats())
+        timeout = self.handler_timeouts.get(method, HANDLER_TIMEOUT)
+        budget = self.latency_budgets.get(method, HANDLER_LATENCY_BUDGET)
+
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(handler_class().handle(event), timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            logger.warning("Handler for %s timed out after %ss", method, timeout)
+        except Exception:
+            stats.failures += 1
+            logger.exception("Handler for %s failed", method)
+        elapsed = time.monotonic() - start
+        stats.record(elapsed)
+
+        if elapsed <= budget:
+            stats.over_budget = 0
+            stats.within_budget += 1
+            if stats.quarantined and stats.within_budget >= HANDLER_RECOVERY_THRESHOLD:
+                stats.quarantined = False
+                logger.info("Handler for %s recovered from quarantine", method)
+            return
+        stats.within_budget = 0
+        stats.over_budget += 1
+        logger.debug("Handler for %s over budget: %.3fs", method, elapsed)
+        if stats.over_budget >= HANDLER_QUARANTINE_THRESHOLD and not stats.quarantined:
+            stats.quarantined = True
+            logger.warning("Handler for %s quarantined to background", method)
+
+    def latency_report(self: ChaturbateAPIClient) -> dict[str, dict[str, Any]]:
+        """Get latency statistics for each event handler.
+
+        Returns
+        -------
+            Dict[str, Dict[str, Any]]: Handler statistics keyed by event method.
+
+        """
+        return {method: stats.to_dict() for method, stats in self.handler_stats.items()}
@@ -1,5 +1,7 @@
 """Configuration for the chaturbate_api package."""
 
+from __future__ import annotations
+
 import os
 
 from dotenv import load_dotenv
@@ -28,3 +30,33 @@ class Config:
         if events_api_url is None:
             raise BaseURLNotFoundError
         return events_api_url
+
+    def get_urls() -> list[str]:
+        """Get the events API URLs of all rooms.
+
+        The URLs are read from the comma-separated EVENTS_API_URLS environment
+        variable, falling back to EVENTS_API_URL.
+
+        Returns
+        -------
+            list[str]: The events API URLs.
+
+        Raises
+        ------
+            BaseURLNotFoundError: If no URL is found.
+
+        """
+        events_api_urls = os.getenv("EVENTS_API_URLS")
+        if events_api_urls is None:
+            return [Config.get_url()]
+        return [url.strip() for url in events_api_urls.split(",") if url.strip()]
+
+    def get_webhook_url() -> str | None:
+        """Get the URL that events are forwarded to, if any.
+
+        Returns
+        -------
+            str | None: The webhook URL, or None if it is not set.
+
+        """
+        return os.getenv("WEBHOOK_URL")
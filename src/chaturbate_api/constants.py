@@ -5,3 +5,25 @@ API_REQUEST_PERIOD = 60
 HTTP_SUCCESS = 200
 HTTP_SERVER_ERROR = 521
 HTTP_CLIENT_ERROR = 404
+HANDLER_TIMEOUT = 10.0
+HANDLER_LATENCY_BUDGET = 1.0
+HANDLER_QUARANTINE_THRESHOLD = 3
+HANDLER_RECOVERY_THRESHOLD = 5
+HANDLER_LANE_SIZE = 1000
+HANDLER_LATENCY_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+WEBHOOK_EVENTS = ("tip", "follow", "mediaPurchase")
+WEBHOOK_BATCH_SIZE = 50
+WEBHOOK_BATCH_INTERVAL = 0.5
+WEBHOOK_MAX_IN_FLIGHT = 4
+WEBHOOK_MAX_RETRIES = 5
+WEBHOOK_RETRY_BACKOFF = 1.0
+WEBHOOK_QUEUE_SIZE = 10000
+WEBHOOK_SPILL_PATH = "webhook_spill.jsonl"
+WEBHOOK_REPLAY_INTERVAL = 30.0
+SUPERVISOR_HASH_REPLICAS = 100
+SUPERVISOR_POLL_INTERVAL = 1.0
+SUPERVISOR_REPORT_INTERVAL = 30.0
+SUPERVISOR_STOP_TIMEOUT = 5.0
+ROOM_RESTART_BACKOFF = 1.0
+ROOM_RESTART_MAX_BACKOFF = 60.0
+SUPERVISOR_MAX_RESPAWNS = 5
@@ -25,3 +25,29 @@ class ChaturbateServerError(Exception):
 
         """
         super().__init__(f"Chaturbate API server error: {status_code}")
+
+
+class WebhookDeliveryError(Exception):
+    """Raised when a webhook target rejects a delivery."""
+
+    def __init__(self: "WebhookDeliveryError", status_code: int) -> None:
+        """Initialize the exception.
+
+        Parameters
+        ----------
+        status_code : int
+            The status code of the webhook response.
+
+        """
+        super().__init__(f"Webhook delivery failed: {status_code}")
+
+
+class NoWorkersLeftError(Exception):
+    """Raised when every supervised worker process has died."""
+
+    def __init__(self: "NoWorkersLeftError") -> None:
+        """Initialize the exception."""
+        msg_error = "No worker processes left."
+        msg_solution = "Check the worker logs for the cause of the crashes."
+        formatted_msg = f"{msg_error}\n{msg_solution}"
+        super().__init__(formatted_msg)
@@ -0,0 +1,85 @@
+"""Module for tracking event handler latency."""
+
+from __future__ import annotations
+
+import bisect
+
+from .constants import HANDLER_LATENCY_BUCKETS
+
+
+class HandlerStats:
+    """Latency statistics for a single event handler.
+
+    Attributes
+    ----------
+        calls (int): Number of completed handler calls.
+        failures (int): Number of calls that raised an exception.
+        timeouts (int): Number of calls that exceeded their timeout.
+        dropped (int): Number of events dropped because the background lane
+            was full.
+        total_time (float): Total time spent in the handler, in seconds.
+        max_time (float): Longest single call, in seconds.
+        over_budget (int): Consecutive calls that exceeded the latency budget.
+        within_budget (int): Consecutive calls within the latency budget.
+        quarantined (bool): Whether the handler runs in the background lane.
+        buckets (List[int]): Call counts per latency bucket, the last entry
+            counting calls slower than the largest bucket bound.
+
+    """
+
+    def __init__(self: HandlerStats) -> None:
+        """Initialize empty handler statistics."""
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.dropped = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.over_budget = 0
+        self.within_budget = 0
+        self.quarantined = False
+        self.buckets = [0] * (len(HANDLER_LATENCY_BUCKETS) + 1)
+
+    def record(self: HandlerStats, elapsed: float) -> None:
+        """Record the duration of a single handler call.
+
+        Args:
+        ----
+            elapsed (float): The call duration, in seconds.
+
+        """
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.buckets[bisect.bisect_left(HANDLER_LATENCY_BUCKETS, elapsed)] += 1
+
+    def histogram(self: HandlerStats) -> dict[str, int]:
+        """Get the latency histogram keyed by bucket upper bound.
+
+        Returns
+        -------
+            Dict[str, int]: Call counts per bucket, e.g. ``{"<=0.1s": 4}``.
+
+        """
+        labels = [f"<={bound}s" for bound in HANDLER_LATENCY_BUCKETS]
+        labels.append(f">{HANDLER_LATENCY_BUCKETS[-1]}s")
+        return dict(zip(labels, self.buckets))
+
+    def to_dict(self: HandlerStats) -> dict[str, object]:
+        """Get a summary of the statistics.
+
+        Returns
+        -------
+            Dict[str, object]: The handler statistics.
+
+        """
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "dropped": self.dropped,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+            "max_time": self.max_time,
+            "quarantined": self.quarantined,
+            "histogram": self.histogram(),
+        }
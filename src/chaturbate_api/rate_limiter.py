@@ -0,0 +1,95 @@
+"""Module for a rate limiter shared between processes."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from typing import TYPE_CHECKING
+
+from .constants import API_REQUEST_LIMIT, API_REQUEST_PERIOD
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from types import TracebackType
+
+
+class SharedRateLimiter:
+    """Token bucket rate limiter shared between processes.
+
+    The bucket state lives in shared memory, so every process holding the
+    limiter draws from the same budget. It can be used in place of an
+    `aiolimiter.AsyncLimiter` as an async context manager.
+
+    Attributes
+    ----------
+        max_rate (float): The number of requests allowed per time period.
+        time_period (float): The length of the time period in seconds.
+
+    """
+
+    def __init__(
+        self: SharedRateLimiter,
+        max_rate: float = API_REQUEST_LIMIT,
+        time_period: float = API_REQUEST_PERIOD,
+        ctx: BaseContext | None = None,
+    ) -> None:
+        """Initialize the shared rate limiter.
+
+        Args:
+        ----
+            max_rate (float, optional): Requests allowed per time period.
+            time_period (float, optional): The time period in seconds.
+            ctx (BaseContext, optional): The multiprocessing context used to
+                create the shared state.
+
+        """
+        ctx = ctx or multiprocessing.get_context()
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._lock = ctx.Lock()
+        self._tokens = ctx.RawValue("d", max_rate)
+        # The monotonic clock is system-wide, so it is consistent across
+        # processes on one host and unaffected by wall clock changes
+        self._updated = ctx.RawValue("d", time.monotonic())
+
+    def try_acquire(self: SharedRateLimiter) -> float:
+        """Take a token from the bucket if one is available.
+
+        Returns
+        -------
+            float: 0 if a token was taken, otherwise seconds until one is.
+
+        """
+        rate = self.max_rate / self.time_period
+        with self._lock:
+            now = time.monotonic()
+            elapsed = max(now - self._updated.value, 0.0)
+            tokens = min(self.max_rate, self._tokens.value + elapsed * rate)
+            self._updated.value = now
+            if tokens >= 1:
+                self._tokens.value = tokens - 1
+                return 0.0
+            self._tokens.value = tokens
+            return (1 - tokens) / rate
+
+    async def acquire(self: SharedRateLimiter) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return
+            # Sleep until the bucket refills, other processes may take the token
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self: SharedRateLimiter) -> None:
+        """Acquire a token."""
+        await self.acquire()
+
+    async def __aexit__(
+        self: SharedRateLimiter,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Do nothing, tokens are not returned."""
@@ -0,0 +1,587 @@
+"""Module for sharding rooms across worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import logging
+import multiprocessing
+import queue
+import signal
+import sys
+import time
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .client import ChaturbateAPIClient
+from .constants import (
+    ROOM_RESTART_BACKOFF,
+    ROOM_RESTART_MAX_BACKOFF,
+    SUPERVISOR_HASH_REPLICAS,
+    SUPERVISOR_MAX_RESPAWNS,
+    SUPERVISOR_POLL_INTERVAL,
+    SUPERVISOR_REPORT_INTERVAL,
+    SUPERVISOR_STOP_TIMEOUT,
+)
+from .event_handlers import event_handlers
+from .exceptions import NoWorkersLeftError
+from .rate_limiter import SharedRateLimiter
+from .webhook import WebhookDelivery
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+
+class HashRing:
+    """Consistent hash ring mapping room URLs to worker IDs.
+
+    Each worker is placed on the ring at several points, so removing a worker
+    only moves the rooms it owned.
+
+    Attributes
+    ----------
+        replicas (int): The number of ring points per worker.
+
+    """
+
+    def __init__(self: HashRing, replicas: int = SUPERVISOR_HASH_REPLICAS) -> None:
+        """Initialize an empty hash ring.
+
+        Args:
+        ----
+            replicas (int, optional): The number of ring points per worker.
+
+        """
+        self.replicas = replicas
+        self._keys: list[int] = []
+        self._nodes: dict[int, int] = {}
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        """Hash a key to a position on the ring."""
+        return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+    def add(self: HashRing, node: int) -> None:
+        """Add a worker to the ring.
+
+        Args:
+        ----
+            node (int): The worker ID.
+
+        """
+        for replica in range(self.replicas):
+            key = self._hash(f"{node}:{replica}")
+            self._nodes[key] = node
+            bisect.insort(self._keys, key)
+
+    def remove(self: HashRing, node: int) -> None:
+        """Remove a worker from the ring.
+
+        Args:
+        ----
+            node (int): The worker ID.
+
+        """
+        for replica in range(self.replicas):
+            key = self._hash(f"{node}:{replica}")
+            del self._nodes[key]
+            self._keys.remove(key)
+
+    def get(self: HashRing, key: str) -> int:
+        """Get the worker that owns a key.
+
+        Args:
+        ----
+            key (str): The key, e.g. a room URL.
+
+        Returns:
+        -------
+            int: The worker ID.
+
+        Raises:
+        ------
+            ValueError: If the ring has no workers.
+
+        """
+        if not self._keys:
+            msg = "Hash ring is empty"
+            raise ValueError(msg)
+        index = bisect.bisect(self._keys, self._hash(key)) % len(self._keys)
+        return self._nodes[self._keys[index]]
+
+
+def room_health(client: ChaturbateAPIClient, task: asyncio.Task) -> dict[str, Any]:
+    """Get the health of a room client.
+
+    Args:
+    ----
+        client (ChaturbateAPIClient): The room client.
+        task (asyncio.Task): The task running the client.
+
+    Returns:
+    -------
+        Dict[str, Any]: The room status, error and handler statistics.
+
+    """
+    error = None
+    if not task.done():
+        status = "running"
+    elif task.cancelled():
+        status = "cancelled"
+    elif task.exception() is not None:
+        status = "failed"
+        error = str(task.exception())
+    else:
+        status = "stopped"
+    return {"status": status, "error": error, "handlers": client.latency_report()}
+
+
+class Worker:
+    """Worker that runs a client for each assigned room.
+
+    Attributes
+    ----------
+        worker_id (int): The worker ID.
+        limiter (SharedRateLimiter): The rate limiter shared by all workers.
+        session (aiohttp.ClientSession): The aiohttp client session.
+        webhook (WebhookDelivery): Optional outbound webhook delivery stage.
+        rooms (Dict[str, Tuple[ChaturbateAPIClient, asyncio.Task]]): The client
+            and task of each assigned room, keyed by events API URL.
+        restarts (Dict[str, int]): The number of restarts of each room.
+
+    """
+
+    def __init__(
+        self: Worker,
+        worker_id: int,
+        limiter: SharedRateLimiter,
+        session: aiohttp.ClientSession,
+        webhook: WebhookDelivery | None = None,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+        ----
+            worker_id (int): The worker ID.
+            limiter (SharedRateLimiter): The rate limiter shared by all workers.
+            session (aiohttp.ClientSession): The aiohttp client session.
+            webhook (WebhookDelivery, optional): Delivery stage that the events
+                of every room are forwarded to.
+
+        """
+        self.worker_id = worker_id
+        self.limiter = limiter
+        self.session = session
+        self.webhook = webhook
+        self.rooms: dict[str, tuple[ChaturbateAPIClient, asyncio.Task]] = {}
+        self.restarts: dict[str, int] = {}
+        self._failures: dict[str, int] = {}
+        self._started: dict[str, float] = {}
+        self._restart_at: dict[str, float] = {}
+
+    def assign(self: Worker, room_urls: list[str]) -> None:
+        """Start clients for new rooms and cancel those no longer assigned.
+
+        Args:
+        ----
+            room_urls (List[str]): The events API URLs of the assigned rooms.
+
+        """
+        for url in set(self.rooms) - set(room_urls):
+            self.rooms.pop(url)[1].cancel()
+            for state in (self.restarts, self._failures, self._restart_at):
+                state.pop(url, None)
+        for url in room_urls:
+            if url in self.rooms:
+                continue
+            client = ChaturbateAPIClient(
+                base_url=url,
+                session=self.session,
+                event_handlers=event_handlers,
+                webhook=self.webhook,
+                limiter=self.limiter,
+            )
+            self._start(url, client)
+        logger.info("Worker %s running %s rooms", self.worker_id, len(self.rooms))
+
+    def _start(self: Worker, url: str, client: ChaturbateAPIClient) -> None:
+        """Start the task running a room client."""
+        task = asyncio.create_task(client.run())
+        task.add_done_callback(self._log_failure)
+        self.rooms[url] = (client, task)
+        self._started[url] = asyncio.get_running_loop().time()
+
+    def restart_failed(self: Worker) -> None:
+        """Restart room clients that failed, with exponential backoff.
+
+        A room that fails is restarted after ROOM_RESTART_BACKOFF seconds,
+        doubling with each consecutive failure up to ROOM_RESTART_MAX_BACKOFF.
+        A room that ran for ROOM_RESTART_MAX_BACKOFF seconds before failing
+        starts over with the shortest delay.
+        """
+        now = asyncio.get_running_loop().time()
+        for url, (client, task) in list(self.rooms.items()):
+            if not task.done() or task.cancelled() or task.exception() is None:
+                continue
+            if url not in self._restart_at:
+                if now - self._started[url] >= ROOM_RESTART_MAX_BACKOFF:
+                    self._failures[url] = 0
+                failures = self._failures.get(url, 0)
+                delay = min(
+                    ROOM_RESTART_BACKOFF * 2**failures,
+                    ROOM_RESTART_MAX_BACKOFF,
+                )
+                self._failures[url] = failures + 1
+                self._restart_at[url] = now + delay
+                logger.warning("Restarting room %s in %ss", url, delay)
+            elif now >= self._restart_at[url]:
+                del self._restart_at[url]
+                self.restarts[url] = self.restarts.get(url, 0) + 1
+                self._start(url, client)
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        """Log the exception of a failed room client."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Room client failed", exc_info=task.exception())
+
+    def report(self: Worker) -> dict[str, Any]:
+        """Get the health of the worker.
+
+        Returns
+        -------
+            Dict[str, Any]: The worker ID and the health of each room.
+
+        """
+        return {
+            "worker": self.worker_id,
+            "rooms": {
+                url: {
+                    **room_health(client, task),
+                    "restarts": self.restarts.get(url, 0),
+                }
+                for url, (client, task) in self.rooms.items()
+            },
+        }
+
+    async def stop(self: Worker) -> None:
+        """Cancel all room clients."""
+        tasks = [task for _, task in self.rooms.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def worker_main(  # noqa: PLR0913, PLR0917
+    worker_id: int,
+    room_urls: list[str],
+    limiter: SharedRateLimiter,
+    control_queue: multiprocessing.Queue,
+    report_queue: multiprocessing.Queue,
+    webhook_url: str | None = None,
+) -> None:
+    """Run a worker until told to stop.
+
+    The control queue receives ``("assign", room_urls)`` to change the set of
+    rooms and ``("stop", None)`` to shut down. Health reports are put on the
+    report queue every SUPERVISOR_REPORT_INTERVAL seconds. If a webhook URL is
+    given, the worker forwards events through its own delivery stage, which
+    spills to ``webhook_spill.<worker_id>.jsonl``.
+
+    Args:
+    ----
+        worker_id (int): The worker ID.
+        room_urls (List[str]): The events API URLs of the assigned rooms.
+        limiter (SharedRateLimiter): The rate limiter shared by all workers.
+        control_queue (multiprocessing.Queue): Commands from the supervisor.
+        report_queue (multiprocessing.Queue): Health reports to the supervisor.
+        webhook_url (str, optional): The URL that events are forwarded to.
+
+    """
+    loop = asyncio.get_running_loop()
+    async with AsyncExitStack() as stack:
+        session = await stack.enter_async_context(aiohttp.ClientSession())
+        webhook = None
+        if webhook_url:
+            webhook = await stack.enter_async_context(
+                WebhookDelivery(
+                    webhook_url,
+                    spill_path=f"webhook_spill.{worker_id}.jsonl",
+                ),
+            )
+        worker = Worker(worker_id, limiter, session, webhook)
+        worker.assign(room_urls)
+        next_report = loop.time()
+        parent = multiprocessing.parent_process()
+        while True:
+            if parent is not None and not parent.is_alive():
+                logger.warning("Supervisor exited, stopping worker %s", worker_id)
+                break
+            try:
+                command, payload = control_queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                if command == "stop":
+                    break
+                worker.assign(payload)
+            worker.restart_failed()
+            if loop.time() >= next_report:
+                report_queue.put(worker.report())
+                next_report = loop.time() + SUPERVISOR_REPORT_INTERVAL
+            await asyncio.sleep(SUPERVISOR_POLL_INTERVAL)
+        await worker.stop()
+
+
+def run_worker(*args: Any) -> None:  # noqa: ANN401
+    """Entry point of a worker process, see `worker_main` for arguments."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(worker_main(*args))
+
+
+class Supervisor:
+    """Supervisor that shards rooms across worker processes.
+
+    Rooms are assigned to workers with a consistent hash ring. A worker that
+    dies is respawned with the same rooms after an exponential backoff, like a
+    failed room client. A worker that dies SUPERVISOR_MAX_RESPAWNS times in a
+    row without running for ROOM_RESTART_MAX_BACKOFF seconds is retired and
+    its rooms are reassigned to the remaining workers. All workers share one
+    rate limiter so together they stay within the API request quota.
+
+    Attributes
+    ----------
+        room_urls (List[str]): The events API URLs of all rooms.
+        workers (int): The number of worker processes to start.
+        webhook_url (str): The URL that workers forward events to, if any.
+        ring (HashRing): The hash ring assigning rooms to workers.
+        limiter (SharedRateLimiter): The rate limiter shared by all workers.
+        health (Dict[int, Dict[str, Any]]): The latest report of each worker.
+
+    """
+
+    def __init__(
+        self: Supervisor,
+        room_urls: Iterable[str],
+        workers: int,
+        webhook_url: str | None = None,
+    ) -> None:
+        """Initialize the supervisor.
+
+        Args:
+        ----
+            room_urls (Iterable[str]): The events API URLs of all rooms.
+            workers (int): The number of worker processes to start.
+            webhook_url (str, optional): The URL that workers forward events to.
+
+        """
+        self.room_urls = list(dict.fromkeys(room_urls))
+        self.workers = workers
+        self.webhook_url = webhook_url
+        self.ring = HashRing()
+        self.health: dict[int, dict[str, Any]] = {}
+        self._ctx = multiprocessing.get_context("spawn")
+        self.limiter = SharedRateLimiter(ctx=self._ctx)
+        self._reports = self._ctx.Queue()
+        self._processes: dict[int, multiprocessing.Process] = {}
+        self._control: dict[int, multiprocessing.Queue] = {}
+        self._assigned: dict[int, list[str]] = {}
+        self._respawns: dict[int, int] = {}
+        self._spawned_at: dict[int, float] = {}
+        self._respawn_at: dict[int, float] = {}
+
+    def assignments(self: Supervisor) -> dict[int, list[str]]:
+        """Get the rooms assigned to each worker on the ring.
+
+        Returns
+        -------
+            Dict[int, List[str]]: Room URLs keyed by worker ID.
+
+        """
+        assigned: dict[int, list[str]] = {}
+        for url in self.room_urls:
+            assigned.setdefault(self.ring.get(url), []).append(url)
+        return assigned
+
+    def start(self: Supervisor) -> None:
+        """Start the worker processes."""
+        for worker_id in range(self.workers):
+            self.ring.add(worker_id)
+        self._assigned = self.assignments()
+        for worker_id in range(self.workers):
+            self._spawn(worker_id)
+
+    def _spawn(self: Supervisor, worker_id: int) -> None:
+        """Start a worker process for the rooms assigned to a worker ID."""
+        control = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=run_worker,
+            args=(
+                worker_id,
+                self._assigned.get(worker_id, []),
+                self.limiter,
+                control,
+                self._reports,
+                self.webhook_url,
+            ),
+            name=f"chaturbate-worker-{worker_id}",
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._control[worker_id] = control
+        self._spawned_at[worker_id] = time.monotonic()
+
+    def check_workers(self: Supervisor) -> None:
+        """Respawn dead workers with backoff, or retire them and reassign rooms.
+
+        A dead worker is respawned after ROOM_RESTART_BACKOFF seconds, doubling
+        with each consecutive failure up to ROOM_RESTART_MAX_BACKOFF. A worker
+        that ran for ROOM_RESTART_MAX_BACKOFF seconds before dying starts over
+        with the shortest delay. A worker that fails SUPERVISOR_MAX_RESPAWNS
+        times in a row is retired.
+
+        Raises
+        ------
+            NoWorkersLeftError: If no workers are left.
+
+        """
+        now = time.monotonic()
+        dead = [
+            worker_id
+            for worker_id, process in self._processes.items()
+            if not process.is_alive()
+        ]
+        retired = False
+        for worker_id in dead:
+            process = self._processes.pop(worker_id)
+            logger.warning(
+                "Worker %s exited with code %s",
+                worker_id,
+                process.exitcode,
+            )
+            self._control.pop(worker_id)
+            self.health.pop(worker_id, None)
+            if self._schedule_respawn(worker_id, now):
+                continue
+            logger.error("Worker %s out of respawns, retiring it", worker_id)
+            self._assigned.pop(worker_id, None)
+            self.ring.remove(worker_id)
+            retired = True
+        for worker_id, respawn_at in list(self._respawn_at.items()):
+            if now >= respawn_at:
+                del self._respawn_at[worker_id]
+                logger.info("Respawning worker %s", worker_id)
+                self._spawn(worker_id)
+        if not self._processes and not self._respawn_at:
+            raise NoWorkersLeftError
+        if not retired:
+            return
+        for worker_id, urls in self.assignments().items():
+            if urls != self._assigned.get(worker_id):
+                self._assigned[worker_id] = urls
+                if worker_id in self._control:
+                    self._control[worker_id].put(("assign", urls))
+
+    def _schedule_respawn(self: Supervisor, worker_id: int, now: float) -> bool:
+        """Schedule a dead worker to be respawned, unless it is out of respawns.
+
+        Args:
+        ----
+            worker_id (int): The worker ID.
+            now (float): The current time of the monotonic clock.
+
+        Returns:
+        -------
+            bool: Whether a respawn was scheduled.
+
+        """
+        if now - self._spawned_at.get(worker_id, now) >= ROOM_RESTART_MAX_BACKOFF:
+            self._respawns[worker_id] = 0
+        respawns = self._respawns.get(worker_id, 0)
+        if respawns >= SUPERVISOR_MAX_RESPAWNS:
+            return False
+        delay = min(ROOM_RESTART_BACKOFF * 2**respawns, ROOM_RESTART_MAX_BACKOFF)
+        self._respawns[worker_id] = respawns + 1
+        self._respawn_at[worker_id] = now + delay
+        logger.warning("Respawning worker %s in %ss", worker_id, delay)
+        return True
+
+    def collect_reports(self: Supervisor) -> None:
+        """Store the health reports sent by workers."""
+        while True:
+            try:
+                report = self._reports.get_nowait()
+            except queue.Empty:
+                return
+            if report["worker"] in self._processes:
+                self.health[report["worker"]] = report
+
+    def metrics(self: Supervisor) -> dict[str, Any]:
+        """Get metrics aggregated over all workers.
+
+        Returns
+        -------
+            Dict[str, Any]: Worker and room counts, room statuses and handler
+            call, failure and timeout totals.
+
+        """
+        statuses: dict[str, int] = {}
+        totals = {"calls": 0, "failures": 0, "timeouts": 0}
+        for report in self.health.values():
+            for room in report["rooms"].values():
+                statuses[room["status"]] = statuses.get(room["status"], 0) + 1
+                for stats in room["handlers"].values():
+                    for key in totals:
+                        totals[key] += stats[key]
+        return {
+            "workers": len(self._processes),
+            "rooms": len(self.room_urls),
+            "room_status": statuses,
+            **totals,
+        }
+
+    def run(self: Supervisor) -> None:
+        """Start the workers and supervise them until none are left.
+
+        SIGTERM stops the workers and exits, the same as KeyboardInterrupt.
+        """
+        previous_handler = signal.signal(signal.SIGTERM, self._handle_sigterm)
+        try:
+            self.start()
+            next_report = time.monotonic() + SUPERVISOR_REPORT_INTERVAL
+            while self._processes or self._respawn_at:
+                time.sleep(SUPERVISOR_POLL_INTERVAL)
+                self.collect_reports()
+                self.check_workers()
+                if time.monotonic() >= next_report:
+                    logger.info("Supervisor metrics: %s", self.metrics())
+                    next_report = time.monotonic() + SUPERVISOR_REPORT_INTERVAL
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
+            self.stop()
+
+    @staticmethod
+    def _handle_sigterm(signum: int, frame: FrameType | None) -> None:  # noqa: ARG004
+        """Exit on SIGTERM so that `run` stops the workers."""
+        logger.info("Received signal %s, stopping workers", signum)
+        sys.exit(0)
+
+    def stop(self: Supervisor) -> None:
+        """Stop all worker processes."""
+        for control in self._control.values():
+            control.put(("stop", None))
+        for process in self._processes.values():
+            process.join(SUPERVISOR_STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        self._processes.clear()
+        self._control.clear()
+        self._respawn_at.clear()
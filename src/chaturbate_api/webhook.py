@@ -0,0 +1,348 @@
+"""Module for batched outbound webhook delivery."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import shutil
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from chaturbate_api.exceptions import WebhookDeliveryError
+
+from .constants import (
+    WEBHOOK_BATCH_INTERVAL,
+    WEBHOOK_BATCH_SIZE,
+    WEBHOOK_EVENTS,
+    WEBHOOK_MAX_IN_FLIGHT,
+    WEBHOOK_MAX_RETRIES,
+    WEBHOOK_QUEUE_SIZE,
+    WEBHOOK_REPLAY_INTERVAL,
+    WEBHOOK_RETRY_BACKOFF,
+    WEBHOOK_SPILL_PATH,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookDelivery:
+    """Batched outbound webhook delivery.
+
+    Events are queued by `submit` and sent to the webhook URL in the background
+    as gzip-compressed JSON arrays, so delivery never blocks the polling loop.
+    Batches that still fail after all retries, and events that arrive while the
+    queue is full, are appended to a spill file. On start, after each successful
+    delivery and every WEBHOOK_REPLAY_INTERVAL seconds, as many spilled events
+    as fit in the queue are replayed.
+
+    Attributes
+    ----------
+        url (str): The URL that event batches are posted to.
+        methods (Tuple[str, ...]): The event methods that are forwarded.
+        batch_size (int): The maximum number of events per request.
+        batch_interval (float): Seconds to wait for a batch to fill.
+        max_retries (int): Retries per batch before it is spilled to disk.
+        retry_backoff (float): Initial retry delay in seconds, doubled per retry.
+        spill_path (Path): The file that undeliverable events are written to.
+
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self: WebhookDelivery,
+        url: str,
+        methods: Iterable[str] = WEBHOOK_EVENTS,
+        batch_size: int = WEBHOOK_BATCH_SIZE,
+        batch_interval: float = WEBHOOK_BATCH_INTERVAL,
+        max_in_flight: int = WEBHOOK_MAX_IN_FLIGHT,
+        max_retries: int = WEBHOOK_MAX_RETRIES,
+        retry_backoff: float = WEBHOOK_RETRY_BACKOFF,
+        spill_path: str | Path = WEBHOOK_SPILL_PATH,
+    ) -> None:
+        """Initialize the webhook delivery stage.
+
+        Args:
+        ----
+            url (str): The URL that event batches are posted to.
+            methods (Iterable[str], optional): The event methods to forward.
+            batch_size (int, optional): The maximum number of events per request.
+            batch_interval (float, optional): Seconds to wait for a batch to fill.
+            max_in_flight (int, optional): The maximum concurrent requests.
+            max_retries (int, optional): Retries before a batch is spilled.
+            retry_backoff (float, optional): Initial retry delay in seconds.
+            spill_path (str | Path, optional): The spill file path.
+
+        """
+        self.url = url
+        self.methods = tuple(methods)
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.spill_path = Path(spill_path)
+        self.session: aiohttp.ClientSession | None = None
+        self._queue: asyncio.Queue[dict[str, Any] | None] | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._worker: asyncio.Task | None = None
+        self._replayer: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._overflow: list[dict[str, Any]] = []
+        self._flushing = False
+        self._spill_lock: asyncio.Lock | None = None
+
+    async def __aenter__(self: Self) -> Self:
+        """Start the delivery stage."""
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self: WebhookDelivery,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Flush pending events and stop the delivery stage."""
+        await self.close()
+
+    async def start(self: WebhookDelivery) -> None:
+        """Open the pooled session and start the batching worker."""
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+        self.session = aiohttp.ClientSession(connector=connector)
+        self._queue = asyncio.Queue(WEBHOOK_QUEUE_SIZE)
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._spill_lock = asyncio.Lock()
+        self._worker = asyncio.create_task(self._run())
+        self._replayer = asyncio.create_task(self._replay_periodically())
+        self._schedule_flush()
+
+    async def close(self: WebhookDelivery) -> None:
+        """Deliver queued events, wait for in-flight requests and close."""
+        if self._replayer is not None:
+            self._replayer.cancel()
+            await asyncio.gather(self._replayer, return_exceptions=True)
+            self._replayer = None
+        if self._worker is not None:
+            worker, self._worker = self._worker, None
+            await self._queue.put(None)
+            await worker
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def submit(self: WebhookDelivery, event: dict[str, Any]) -> None:
+        """Queue an event for delivery without waiting.
+
+        Events whose method is not forwarded are ignored. If the queue is full
+        or the delivery stage is not running, the event is buffered and written
+        to the spill file together with other overflowing events.
+
+        Args:
+        ----
+            event (Dict[str, Any]): The event to deliver.
+
+        """
+        if event.get("method") not in self.methods:
+            return
+        if self._worker is not None:
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+            else:
+                return
+        self._overflow.append(event)
+        self._schedule_flush()
+
+    def _schedule_flush(self: WebhookDelivery) -> None:
+        """Start a task writing buffered overflow events, unless one is running."""
+        if self._overflow and self._spill_lock is not None and not self._flushing:
+            self._flushing = True
+            self._track(asyncio.create_task(self._flush_overflow()))
+
+    async def _flush_overflow(self: WebhookDelivery) -> None:
+        """Write buffered overflow events to the spill file."""
+        try:
+            while self._overflow:
+                events, self._overflow = self._overflow, []
+                await self._spill(events)
+        finally:
+            self._flushing = False
+
+    async def _run(self: WebhookDelivery) -> None:
+        """Collect queued events into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            event = await self._queue.get()
+            if event is None:
+                break
+            batch = [event]
+            deadline = loop.time() + self.batch_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+            await self._semaphore.acquire()
+            self._track(asyncio.create_task(self._deliver(batch)))
+
+    async def _deliver(self: WebhookDelivery, batch: list[dict[str, Any]]) -> None:
+        """Post a batch with retries, spilling it to disk if every attempt fails.
+
+        Args:
+        ----
+            batch (List[Dict[str, Any]]): The events to deliver.
+
+        """
+        try:
+            body = gzip.compress(json.dumps(batch).encode())
+            for attempt in range(self.max_retries + 1):
+                if await self._attempt(body, attempt):
+                    logger.debug("Delivered %s events to webhook", len(batch))
+                    break
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * 2**attempt)
+            else:
+                await self._spill(batch)
+                return
+        finally:
+            self._semaphore.release()
+        if self._worker is not None and self.spill_path.exists():
+            await self._replay()
+
+    async def _attempt(self: WebhookDelivery, body: bytes, attempt: int) -> bool:
+        """Post a request body once.
+
+        Args:
+        ----
+            body (bytes): The gzip-compressed JSON request body.
+            attempt (int): The zero-based attempt number, used for logging.
+
+        Returns:
+        -------
+            bool: Whether the webhook accepted the request.
+
+        """
+        try:
+            await self._post(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError, WebhookDeliveryError):
+            logger.warning(
+                "Webhook delivery attempt %s failed",
+                attempt + 1,
+                exc_info=True,
+            )
+            return False
+        return True
+
+    async def _post(self: WebhookDelivery, body: bytes) -> None:
+        """Post a request body to the webhook URL.
+
+        Args:
+        ----
+            body (bytes): The gzip-compressed JSON request body.
+
+        Raises:
+        ------
+            WebhookDeliveryError: If the webhook rejects the request.
+
+        """
+        headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        async with self.session.post(self.url, data=body, headers=headers) as response:
+            if not response.ok:
+                raise WebhookDeliveryError(response.status)
+
+    async def _spill(self: WebhookDelivery, events: list[dict[str, Any]]) -> None:
+        """Append undeliverable events to the spill file.
+
+        Args:
+        ----
+            events (List[Dict[str, Any]]): The events to spill.
+
+        """
+        logger.warning("Spilling %s events to %s", len(events), self.spill_path)
+        lines = "".join(json.dumps(event) + "\n" for event in events)
+        async with self._spill_lock:
+            await asyncio.to_thread(self._append_spill, lines)
+
+    def _append_spill(self: WebhookDelivery, lines: str) -> None:
+        """Append lines to the spill file.
+
+        If an earlier append was cut short, the torn line is terminated first
+        so it doesn't swallow the first new event.
+        """
+        with self.spill_path.open("a+b") as spill_file:
+            if spill_file.tell():
+                spill_file.seek(-1, 2)
+                if spill_file.read(1) != b"\n":
+                    spill_file.write(b"\n")
+            spill_file.write(lines.encode())
+
+    def _take_spill(self: WebhookDelivery, limit: int) -> list[dict[str, Any]]:
+        """Remove and parse up to `limit` lines from the start of the spill file.
+
+        Malformed lines are logged and skipped. The remaining lines are copied
+        to a temporary file that then replaces the spill file, or the spill
+        file is removed if nothing remains.
+        """
+        remainder = self.spill_path.with_name(self.spill_path.name + ".tmp")
+        with self.spill_path.open(encoding="utf-8") as spill_file:
+            lines = list(islice(spill_file, limit))
+            with remainder.open("w", encoding="utf-8") as remainder_file:
+                shutil.copyfileobj(spill_file, remainder_file)
+        events = []
+        for line in lines:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:  # noqa: PERF203
+                logger.warning("Skipping malformed spilled event: %r", line)
+        if remainder.stat().st_size:
+            remainder.replace(self.spill_path)
+        else:
+            remainder.unlink()
+            self.spill_path.unlink()
+        return events
+
+    async def _replay(self: WebhookDelivery) -> None:
+        """Queue as many spilled events as fit in the queue."""
+        if self._spill_lock.locked():
+            return
+        async with self._spill_lock:
+            free = self._queue.maxsize - self._queue.qsize()
+            if free <= 0 or not self.spill_path.exists():
+                return
+            events = await asyncio.to_thread(self._take_spill, free)
+        logger.info("Replaying %s spilled webhook events", len(events))
+        for event in events:
+            self.submit(event)
+
+    async def _replay_periodically(self: WebhookDelivery) -> None:
+        """Replay spilled events on start and every WEBHOOK_REPLAY_INTERVAL."""
+        while True:
+            if self.spill_path.exists():
+                await self._replay()
+            await asyncio.sleep(WEBHOOK_REPLAY_INTERVAL)
+
+    def _track(self: WebhookDelivery, task: asyncio.Task) -> None:
+        """Keep a reference to a background task until it finishes."""
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -1,13 +1,39 @@
 """Tests for the Chaturbate API client."""
 
+import asyncio
 import json
+import time
 import unittest
+from unittest import mock
 
 import aiohttp
 from aioresponses import aioresponses
 from chaturbate_api.client import ChaturbateAPIClient
 from chaturbate_api.event_handlers import event_handlers
 from chaturbate_api.exceptions import ChaturbateServerError
+from chaturbate_api.handler_stats import HandlerStats
+
+
+class FailingEventHandler:
+    """Handler that always raises an exception."""
+
+    @staticmethod
+    async def handle(message: dict) -> dict:
+        """Raise an exception."""
+        msg = f"Failed to handle {message['method']}"
+        raise RuntimeError(msg)
+
+
+class SlowEventHandler:
+    """Handler that takes longer than its latency budget."""
+
+    delay = 0.05
+
+    @classmethod
+    async def handle(cls: type["SlowEventHandler"], message: dict) -> dict:
+        """Sleep before returning."""
+        await asyncio.sleep(cls.delay)
+        return {"event": message["method"]}
 
 
 class TestChaturbateAPIClient(unittest.IsolatedAsyncioTestCase):
@@ -161,6 +187,192 @@ class TestChaturbateAPIClient(unittest.IsolatedAsyncioTestCase):
             except json.JSONDecodeError:
                 pass
 
+    async def test_process_event_isolates_handler_errors(
+        self: "TestChaturbateAPIClient",
+    ) -> None:
+        """Test a failing handler is logged without stopping the client."""
+        client = ChaturbateAPIClient(
+            "https://events.testbed.cb.dev",
+            self.session,
+            {"tip": FailingEventHandler},
+        )
+
+        with self.assertLogs(level="ERROR") as log:
+            await client.process_event({"method": "tip", "object": {}})
+
+        if not any("Handler for tip failed" in message for message in log.output):
+            msg = "Log message not found"
+            raise AssertionError(msg)
+        if client.handler_stats["tip"].failures != 1:
+            msg = "Failure count mismatch"
+            raise AssertionError(msg)
+
+    async def test_process_event_handler_timeout(
+        self: "TestChaturbateAPIClient",
+    ) -> None:
+        """Test a handler that exceeds its timeout is cancelled."""
+        client = ChaturbateAPIClient(
+            "https://events.testbed.cb.dev",
+            self.session,
+            {"tip": SlowEventHandler},
+            handler_timeouts={"tip": 0.01},
+        )
+
+        with self.assertLogs(level="WARNING") as log:
+            await client.process_event({"method": "tip", "object": {}})
+
+        if not any("timed out" in message for message in log.output):
+            msg = "Log message not found"
+            raise AssertionError(msg)
+        if client.handler_stats["tip"].timeouts != 1:
+            msg = "Timeout count mismatch"
+            raise AssertionError(msg)
+
+    async def test_process_event_quarantines_slow_handler(
+        self: "TestChaturbateAPIClient",
+    ) -> None:
+        """Test a handler repeatedly over budget is moved to the background."""
+        client = ChaturbateAPIClient(
+            "https://events.testbed.cb.dev",
+            self.session,
+            {"tip": SlowEventHandler},
+            latency_budgets={"tip": 0.01},
+        )
+        event = {"method": "tip", "object": {}}
+
+        with self.assertLogs(level="WARNING") as log:
+            for _ in range(3):
+                await client.process_event(event)
+
+        if not client.handler_stats["tip"].quarantined:
+            msg = "Handler was not quarantined"
+            raise AssertionError(msg)
+        if not any("quarantined" in message for message in log.output):
+            msg = "Log message not found"
+            raise AssertionError(msg)
+
+        for _ in range(5):
+            await client.process_event(event)
+        if client.handler_stats["tip"].calls != 3:  # noqa: PLR2004
+            msg = "Quarantined handler should not block process_event"
+            raise AssertionError(msg)
+        lane, _ = client._lanes["tip"]  # noqa: SLF001
+        if lane.qsize() != 5:  # noqa: PLR2004
+            msg = "Events were not queued on a single background lane"
+            raise AssertionError(msg)
+        await client.close_lanes()
+
+        report = client.latency_report()
+        if report["tip"]["calls"] != 8:  # noqa: PLR2004
+            msg = "Latency report call count mismatch"
+            raise AssertionError(msg)
+
+    async def test_process_event_recovers_quarantined_handler(
+        self: "TestChaturbateAPIClient",
+    ) -> None:
+        """Test a quarantined handler is restored once it is within budget."""
+
+        class RecoveringEventHandler(SlowEventHandler):
+            """Handler that becomes fast again."""
+
+        client = ChaturbateAPIClient(
+            "https://events.testbed.cb.dev",
+            self.session,
+            {"tip": RecoveringEventHandler},
+            latency_budgets={"tip": 0.01},
+        )
+        event = {"method": "tip", "object": {}}
+
+        with self.assertLogs(level="WARNING"):
+            for _ in range(3):
+                await client.process_event(event)
+        RecoveringEventHandler.delay = 0
+
+        for _ in range(5):
+            await client.process_event(event)
+        await client.close_lanes()
+
+        if client.handler_stats["tip"].quarantined:
+            msg = "Handler was not restored from quarantine"
+            raise AssertionError(msg)
+        await client.process_event(event)
+        if client._lanes:  # noqa: SLF001
+            msg = "Recovered handler should run inline"
+            raise AssertionError(msg)
+
+    async def test_process_event_forwards_to_webhook(
+        self: "TestChaturbateAPIClient",
+    ) -> None:
+        """Test events are submitted to the webhook delivery stage."""
+        submitted = []
+
+        class RecordingWebhook:
+            """Webhook stand-in that records submitted events."""
+
+            def submit(self: "RecordingWebhook", event: dict) -> None:
+                """Record the event."""
+                submitted.append(event)
+
+        client = ChaturbateAPIClient(
+            "https://events.testbed.cb.dev",
+            self.session,
+            {"tip": SlowEventHandler},
+            webhook=RecordingWebhook(),
+        )
+        event = {"method": "tip", "object": {}}
+
+        await client.process_event(event)
+
+        if submitted != [event]:
+            msg = "Event was not forwarded to the webhook"
+            raise AssertionError(msg)
+
+    async def test_run_cancel_drops_quarantined_events(
+        self: "TestChaturbateAPIClient",
+    ) -> None:
+        """Test cancelling run does not wait for a hanging quarantined handler."""
+
+        class HangingEventHandler(SlowEventHandler):
+            """Handler that hangs."""
+
+            delay = 30
+
+        base_url = "https://events.testbed.cb.dev/events/user_name/api_key"
+        client = ChaturbateAPIClient(
+            base_url,
+            self.session,
+            {"tip": HangingEventHandler},
+            handler_timeouts={"tip": 60},
+        )
+        client.handler_stats["tip"] = HandlerStats()
+        client.handler_stats["tip"].quarantined = True
+        events = [{"method": "tip", "object": {}} for _ in range(20)]
+        responses = [(events, base_url)]
+
+        async def get_events(url: str) -> tuple[list, str]:
+            if responses:
+                return responses.pop()
+            await asyncio.sleep(60)
+            return [], url
+
+        with mock.patch.object(client, "get_events", side_effect=get_events):
+            task = asyncio.create_task(client.run())
+            await asyncio.sleep(0.05)
+            start = time.monotonic()
+            task.cancel()
+            with self.assertLogs(level="WARNING"):
+                await asyncio.gather(task, return_exceptions=True)
+
+        if time.monotonic() - start > 1:
+            msg = "Cancelled run waited for the quarantined handler"
+            raise AssertionError(msg)
+        if client.handler_stats["tip"].dropped != 19:  # noqa: PLR2004
+            msg = "Queued events were not counted as dropped"
+            raise AssertionError(msg)
+        if client._lanes:  # noqa: SLF001
+            msg = "Background lanes were not cancelled"
+            raise AssertionError(msg)
+
 
 if __name__ == "__main__":
     unittest.main()
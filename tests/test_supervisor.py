@@ -0,0 +1,365 @@
+"""Tests for the room sharding supervisor."""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+import time
+import unittest
+from unittest import mock
+
+import aiohttp
+from chaturbate_api import supervisor as supervisor_module
+from chaturbate_api.constants import (
+    ROOM_RESTART_BACKOFF,
+    ROOM_RESTART_MAX_BACKOFF,
+    SUPERVISOR_MAX_RESPAWNS,
+)
+from chaturbate_api.exceptions import NoWorkersLeftError
+from chaturbate_api.rate_limiter import SharedRateLimiter
+from chaturbate_api.supervisor import HashRing, Supervisor, Worker
+
+ROOM_URLS = [
+    f"https://events.testbed.cb.dev/events/user_{index}/api_key" for index in range(50)
+]
+
+
+class FakeProcess:
+    """Worker process stand-in."""
+
+    def __init__(self: "FakeProcess", *, alive: bool) -> None:
+        """Initialize the process state."""
+        self.alive = alive
+        self.exitcode = None if alive else 1
+
+    def is_alive(self: "FakeProcess") -> bool:
+        """Return whether the process is alive."""
+        return self.alive
+
+
+class TestHashRing(unittest.TestCase):
+    """Tests for the consistent hash ring."""
+
+    def test_remove_only_moves_removed_keys(self: "TestHashRing") -> None:
+        """Test removing a worker only reassigns the keys it owned."""
+        ring = HashRing()
+        for worker_id in range(4):
+            ring.add(worker_id)
+        before = {url: ring.get(url) for url in ROOM_URLS}
+
+        ring.remove(2)
+        after = {url: ring.get(url) for url in ROOM_URLS}
+
+        if set(before.values()) != {0, 1, 2, 3}:
+            msg = "Keys not spread over all workers"
+            raise AssertionError(msg)
+        for url, worker_id in before.items():
+            if worker_id != 2 and after[url] != worker_id:  # noqa: PLR2004
+                msg = "Key moved between surviving workers"
+                raise AssertionError(msg)
+        if 2 in after.values():  # noqa: PLR2004
+            msg = "Key assigned to removed worker"
+            raise AssertionError(msg)
+
+    def test_empty_ring(self: "TestHashRing") -> None:
+        """Test looking up a key on an empty ring raises ValueError."""
+        try:
+            HashRing().get(ROOM_URLS[0])
+            msg = "Expected ValueError was not raised"
+            raise AssertionError(msg)
+        except ValueError as err:
+            if "empty" not in str(err):
+                msg = "Unexpected error message"
+                raise AssertionError(msg) from err
+
+
+class TestSharedRateLimiter(unittest.TestCase):
+    """Tests for the shared rate limiter."""
+
+    def test_budget_shared_between_processes(
+        self: "TestSharedRateLimiter",
+    ) -> None:
+        """Test tokens taken in a child process deplete the parent's budget."""
+        ctx = multiprocessing.get_context("spawn")
+        limiter = SharedRateLimiter(max_rate=2, time_period=60, ctx=ctx)
+
+        process = ctx.Process(target=limiter.try_acquire)
+        process.start()
+        process.join()
+
+        if limiter.try_acquire() != 0:
+            msg = "Expected a token to be available"
+            raise AssertionError(msg)
+        if limiter.try_acquire() <= 0:
+            msg = "Expected the shared budget to be exhausted"
+            raise AssertionError(msg)
+
+
+class TestSupervisor(unittest.TestCase):
+    """Tests for the supervisor."""
+
+    def test_check_workers_rebalances_dead_worker(
+        self: "TestSupervisor",
+    ) -> None:
+        """Test the rooms of a worker out of respawns go to live workers."""
+        supervisor = Supervisor(ROOM_URLS, workers=3)
+        for worker_id in range(3):
+            supervisor.ring.add(worker_id)
+        supervisor._assigned = supervisor.assignments()  # noqa: SLF001
+        supervisor._respawns = {1: SUPERVISOR_MAX_RESPAWNS}  # noqa: SLF001
+        supervisor._processes = {  # noqa: SLF001
+            0: FakeProcess(alive=True),
+            1: FakeProcess(alive=False),
+            2: FakeProcess(alive=True),
+        }
+        supervisor._control = {worker_id: queue.Queue() for worker_id in range(3)}  # noqa: SLF001
+        control = dict(supervisor._control)  # noqa: SLF001
+
+        with self.assertLogs(level="WARNING"):
+            supervisor.check_workers()
+
+        reassigned = []
+        for worker_id in (0, 2):
+            command, urls = control[worker_id].get_nowait()
+            if command != "assign":
+                msg = "Expected an assign command"
+                raise AssertionError(msg)
+            reassigned.extend(urls)
+        if sorted(reassigned) != sorted(ROOM_URLS):
+            msg = "Rooms were not reassigned to the live workers"
+            raise AssertionError(msg)
+
+    def test_check_workers_respawns_dead_worker(
+        self: "TestSupervisor",
+    ) -> None:
+        """Test a dead worker is respawned with the same worker ID after a delay."""
+        supervisor = Supervisor(ROOM_URLS, workers=2)
+        for worker_id in range(2):
+            supervisor.ring.add(worker_id)
+        supervisor._processes = {  # noqa: SLF001
+            0: FakeProcess(alive=True),
+            1: FakeProcess(alive=False),
+        }
+        supervisor._control = {worker_id: queue.Queue() for worker_id in range(2)}  # noqa: SLF001
+
+        patcher = mock.patch.object(supervisor, "_spawn")
+        with patcher as spawn, self.assertLogs(level="WARNING"):
+            supervisor.check_workers()
+            spawn.assert_not_called()
+            supervisor._respawn_at[1] = time.monotonic()  # noqa: SLF001
+            supervisor.check_workers()
+
+        spawn.assert_called_once_with(1)
+        if 1 not in supervisor.assignments():
+            msg = "Respawned worker was removed from the ring"
+            raise AssertionError(msg)
+
+    def test_check_workers_backs_off_respawns(self: "TestSupervisor") -> None:
+        """Test respawn delays double, and reset after the worker ran stably."""
+        supervisor = Supervisor(ROOM_URLS, workers=1)
+        supervisor.ring.add(0)
+        supervisor._respawns = {0: SUPERVISOR_MAX_RESPAWNS - 1}  # noqa: SLF001
+        supervisor._spawned_at = {  # noqa: SLF001
+            0: time.monotonic() - ROOM_RESTART_MAX_BACKOFF,
+        }
+        supervisor._processes = {0: FakeProcess(alive=False)}  # noqa: SLF001
+        supervisor._control = {0: queue.Queue()}  # noqa: SLF001
+
+        with self.assertLogs(level="WARNING") as log:
+            supervisor.check_workers()
+
+        if supervisor._respawns[0] != 1:  # noqa: SLF001
+            msg = "Respawn count was not reset after a stable run"
+            raise AssertionError(msg)
+        if not any(f"in {ROOM_RESTART_BACKOFF}s" in message for message in log.output):
+            msg = "Expected the shortest respawn delay"
+            raise AssertionError(msg)
+
+        supervisor._processes = {0: FakeProcess(alive=False)}  # noqa: SLF001
+        supervisor._control = {0: queue.Queue()}  # noqa: SLF001
+        supervisor._respawn_at.clear()  # noqa: SLF001
+        supervisor._spawned_at[0] = time.monotonic()  # noqa: SLF001
+        with self.assertLogs(level="WARNING") as log:
+            supervisor.check_workers()
+
+        if not any(
+            f"in {ROOM_RESTART_BACKOFF * 2}s" in message for message in log.output
+        ):
+            msg = "Expected the respawn delay to double"
+            raise AssertionError(msg)
+
+    def test_check_workers_raises_when_none_left(
+        self: "TestSupervisor",
+    ) -> None:
+        """Test NoWorkersLeftError is raised once every worker is retired."""
+        supervisor = Supervisor(ROOM_URLS, workers=1)
+        supervisor.ring.add(0)
+        supervisor._respawns = {0: SUPERVISOR_MAX_RESPAWNS}  # noqa: SLF001
+        supervisor._processes = {0: FakeProcess(alive=False)}  # noqa: SLF001
+        supervisor._control = {0: queue.Queue()}  # noqa: SLF001
+
+        try:
+            with self.assertLogs(level="WARNING"):
+                supervisor.check_workers()
+            msg = "Expected NoWorkersLeftError was not raised"
+            raise AssertionError(msg)
+        except NoWorkersLeftError:
+            pass
+
+    def test_run_stops_workers_on_sigterm(self: "TestSupervisor") -> None:
+        """Test SIGTERM makes run stop the workers and exit."""
+        supervisor = Supervisor(ROOM_URLS, workers=1)
+
+        def start() -> None:
+            os.kill(os.getpid(), signal.SIGTERM)
+            time.sleep(1)
+
+        start_patcher = mock.patch.object(supervisor, "start", side_effect=start)
+        stop_patcher = mock.patch.object(supervisor, "stop")
+        with start_patcher, stop_patcher as stop:
+            try:
+                with self.assertLogs(level="INFO"):
+                    supervisor.run()
+                msg = "Expected SystemExit was not raised"
+                raise AssertionError(msg)
+            except SystemExit as err:
+                if err.code != 0:
+                    msg = "Unexpected exit code"
+                    raise AssertionError(msg) from err
+
+        stop.assert_called_once_with()
+        if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+            msg = "SIGTERM handler was not restored"
+            raise AssertionError(msg)
+
+    def test_metrics_aggregates_reports(self: "TestSupervisor") -> None:
+        """Test metrics are aggregated across worker reports."""
+        supervisor = Supervisor(ROOM_URLS[:2], workers=2)
+        supervisor._processes = {0: FakeProcess(alive=True)}  # noqa: SLF001
+        handlers = {"tip": {"calls": 3, "failures": 1, "timeouts": 0}}
+        supervisor.health = {
+            0: {
+                "worker": 0,
+                "rooms": {
+                    ROOM_URLS[0]: {"status": "running", "handlers": handlers},
+                    ROOM_URLS[1]: {"status": "failed", "handlers": handlers},
+                },
+            },
+        }
+
+        metrics = supervisor.metrics()
+
+        expected = {
+            "workers": 1,
+            "rooms": 2,
+            "room_status": {"running": 1, "failed": 1},
+            "calls": 6,
+            "failures": 2,
+            "timeouts": 0,
+        }
+        if metrics != expected:
+            msg = "Metrics mismatch"
+            raise AssertionError(msg)
+
+
+class TestWorker(unittest.IsolatedAsyncioTestCase):
+    """Tests for the worker."""
+
+    async def asyncSetUp(self: "TestWorker") -> None:
+        """Set up the test by creating a session."""
+        self.session = aiohttp.ClientSession()
+
+    async def asyncTearDown(self: "TestWorker") -> None:
+        """Tear down the test by closing the session."""
+        await self.session.close()
+
+    async def test_restart_failed_room(self: "TestWorker") -> None:
+        """Test a room whose client fails is restarted after a backoff."""
+        invalid_url = "https://invalid_url.com"
+        worker = Worker(0, SharedRateLimiter(), self.session)
+
+        with mock.patch.object(supervisor_module, "ROOM_RESTART_BACKOFF", 0):
+            with self.assertLogs(level="WARNING"):
+                worker.assign([invalid_url])
+                await asyncio.sleep(0)
+                failed_task = worker.rooms[invalid_url][1]
+                worker.restart_failed()
+                worker.restart_failed()
+            await worker.stop()
+
+        if worker.rooms[invalid_url][1] is failed_task:
+            msg = "Failed room was not restarted"
+            raise AssertionError(msg)
+        if worker.report()["rooms"][invalid_url]["restarts"] != 1:
+            msg = "Restart count mismatch"
+            raise AssertionError(msg)
+
+    async def test_worker_exits_without_parent(self: "TestWorker") -> None:
+        """Test a worker stops once its supervisor process is gone."""
+        parent = mock.Mock()
+        parent.is_alive.return_value = False
+
+        patcher = mock.patch.object(
+            supervisor_module.multiprocessing,
+            "parent_process",
+            return_value=parent,
+        )
+        with patcher, self.assertLogs(level="WARNING") as log:
+            await asyncio.wait_for(
+                supervisor_module.worker_main(
+                    0,
+                    [],
+                    SharedRateLimiter(),
+                    queue.Queue(),
+                    queue.Queue(),
+                ),
+                timeout=1,
+            )
+
+        if not any("Supervisor exited" in message for message in log.output):
+            msg = "Log message not found"
+            raise AssertionError(msg)
+
+    async def test_worker_forwards_to_own_webhook(self: "TestWorker") -> None:
+        """Test a worker gives its rooms a webhook stage with its own spill file."""
+        parent = mock.Mock()
+        parent.is_alive.return_value = False
+        webhook = mock.MagicMock()
+        webhook.__aenter__.return_value = webhook
+        webhook_url = "https://hooks.example.com/events"
+
+        parent_patcher = mock.patch.object(
+            supervisor_module.multiprocessing,
+            "parent_process",
+            return_value=parent,
+        )
+        webhook_patcher = mock.patch.object(
+            supervisor_module,
+            "WebhookDelivery",
+            return_value=webhook,
+        )
+        client_patcher = mock.patch.object(supervisor_module, "ChaturbateAPIClient")
+        with parent_patcher, webhook_patcher as delivery, client_patcher as client:
+            client.return_value.run = mock.AsyncMock()
+            await supervisor_module.worker_main(
+                3,
+                [ROOM_URLS[0]],
+                SharedRateLimiter(),
+                queue.Queue(),
+                queue.Queue(),
+                webhook_url,
+            )
+
+        delivery.assert_called_once_with(
+            webhook_url,
+            spill_path="webhook_spill.3.jsonl",
+        )
+        webhook.__aexit__.assert_awaited_once()
+        if client.call_args.kwargs["webhook"] is not webhook:
+            msg = "Room client was not given the worker's webhook"
+            raise AssertionError(msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
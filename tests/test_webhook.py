@@ -0,0 +1,211 @@
+"""Tests for the webhook delivery stage."""
+
+import asyncio
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aioresponses import aioresponses
+from chaturbate_api import webhook
+from chaturbate_api.webhook import WebhookDelivery
+
+WEBHOOK_URL = "https://hooks.example.com/events"
+
+
+def tip_event(tokens: int) -> dict:
+    """Build a tip event."""
+    return {"method": "tip", "object": {"tip": {"tokens": tokens}}}
+
+
+class TestWebhookDelivery(unittest.IsolatedAsyncioTestCase):
+    """Tests for the webhook delivery stage."""
+
+    def setUp(self: "TestWebhookDelivery") -> None:
+        """Set up a temporary directory for the spill file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.spill_path = Path(self.tmp_dir.name) / "spill.jsonl"
+
+    def tearDown(self: "TestWebhookDelivery") -> None:
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    async def test_delivers_gzip_batches(self: "TestWebhookDelivery") -> None:
+        """Test events are posted as gzip-compressed batches."""
+        with aioresponses() as mocked_responses:
+            mocked_responses.post(WEBHOOK_URL, status=200, repeat=True)
+
+            async with WebhookDelivery(
+                WEBHOOK_URL,
+                batch_size=2,
+                batch_interval=0.01,
+                spill_path=self.spill_path,
+            ) as webhook:
+                for tokens in range(3):
+                    webhook.submit(tip_event(tokens))
+                webhook.submit({"method": "chatMessage", "object": {}})
+
+            calls = next(iter(mocked_responses.requests.values()))
+
+        batches = [json.loads(gzip.decompress(call.kwargs["data"])) for call in calls]
+        if batches != [[tip_event(0), tip_event(1)], [tip_event(2)]]:
+            msg = "Batches mismatch"
+            raise AssertionError(msg)
+        if calls[0].kwargs["headers"]["Content-Encoding"] != "gzip":
+            msg = "Request body is not gzip encoded"
+            raise AssertionError(msg)
+
+    async def test_spills_failed_batches(self: "TestWebhookDelivery") -> None:
+        """Test batches are spilled to disk when every retry fails."""
+        with aioresponses() as mocked_responses:
+            mocked_responses.post(WEBHOOK_URL, status=503, repeat=True)
+
+            async with WebhookDelivery(
+                WEBHOOK_URL,
+                batch_interval=0.01,
+                max_retries=1,
+                retry_backoff=0.01,
+                spill_path=self.spill_path,
+            ) as webhook:
+                webhook.submit(tip_event(10))
+
+            calls = next(iter(mocked_responses.requests.values()))
+
+        if len(calls) != 2:  # noqa: PLR2004
+            msg = "Expected one retry"
+            raise AssertionError(msg)
+        spilled = self.spill_path.read_text(encoding="utf-8").splitlines()
+        if [json.loads(line) for line in spilled] != [tip_event(10)]:
+            msg = "Spilled events mismatch"
+            raise AssertionError(msg)
+
+    async def test_replays_spilled_events(self: "TestWebhookDelivery") -> None:
+        """Test spilled events are delivered after a successful delivery."""
+        self.spill_path.write_text(json.dumps(tip_event(1)) + "\n", encoding="utf-8")
+
+        with aioresponses() as mocked_responses:
+            mocked_responses.post(WEBHOOK_URL, status=200, repeat=True)
+
+            async with WebhookDelivery(
+                WEBHOOK_URL,
+                batch_interval=0.01,
+                spill_path=self.spill_path,
+            ) as webhook:
+                webhook.submit(tip_event(2))
+                for _ in range(100):
+                    if not self.spill_path.exists():
+                        break
+                    await asyncio.sleep(0.01)
+
+            calls = next(iter(mocked_responses.requests.values()))
+
+        events = [
+            event
+            for call in calls
+            for event in json.loads(gzip.decompress(call.kwargs["data"]))
+        ]
+        if events != [tip_event(2), tip_event(1)]:
+            msg = "Replayed events mismatch"
+            raise AssertionError(msg)
+
+    async def test_spills_overflow_in_one_batch(self: "TestWebhookDelivery") -> None:
+        """Test events that do not fit in the queue are spilled together."""
+        with mock.patch.object(webhook, "WEBHOOK_QUEUE_SIZE", 2):
+            delivery = WebhookDelivery(WEBHOOK_URL, spill_path=self.spill_path)
+            await delivery.start()
+            with self.assertLogs(level="WARNING") as log:
+                for tokens in range(10):
+                    delivery.submit(tip_event(tokens))
+                await asyncio.gather(*delivery._tasks)  # noqa: SLF001
+            delivery._worker.cancel()  # noqa: SLF001
+            await delivery.session.close()
+
+        if len(log.output) != 1 or "Spilling 8 events" not in log.output[0]:
+            msg = "Expected a single spill of the overflowing events"
+            raise AssertionError(msg)
+        spilled = self.spill_path.read_text(encoding="utf-8").splitlines()
+        if [json.loads(line) for line in spilled] != [
+            tip_event(tokens) for tokens in range(2, 10)
+        ]:
+            msg = "Spilled events mismatch"
+            raise AssertionError(msg)
+
+    async def test_replays_in_chunks(self: "TestWebhookDelivery") -> None:
+        """Test replay takes no more events than fit in the queue."""
+        self.spill_path.write_text(
+            "".join(json.dumps(tip_event(tokens)) + "\n" for tokens in range(5)),
+            encoding="utf-8",
+        )
+        with mock.patch.object(webhook, "WEBHOOK_QUEUE_SIZE", 2):
+            delivery = WebhookDelivery(WEBHOOK_URL, spill_path=self.spill_path)
+            await delivery.start()
+            delivery._worker.cancel()  # noqa: SLF001
+            delivery._replayer.cancel()  # noqa: SLF001
+            await delivery._replay()  # noqa: SLF001
+            await delivery.session.close()
+
+        queued = [delivery._queue.get_nowait() for _ in range(2)]  # noqa: SLF001
+        if queued != [tip_event(0), tip_event(1)]:
+            msg = "Replayed chunk mismatch"
+            raise AssertionError(msg)
+        remaining = self.spill_path.read_text(encoding="utf-8").splitlines()
+        if [json.loads(line) for line in remaining] != [
+            tip_event(tokens) for tokens in range(2, 5)
+        ]:
+            msg = "Remaining spilled events mismatch"
+            raise AssertionError(msg)
+
+    async def test_replays_on_start_skipping_malformed_lines(
+        self: "TestWebhookDelivery",
+    ) -> None:
+        """Test a spill file left by an earlier run is replayed on start."""
+        self.spill_path.write_text(
+            json.dumps(tip_event(1)) + "\n" + json.dumps(tip_event(2)) + '\n{"meth',
+            encoding="utf-8",
+        )
+
+        with aioresponses() as mocked_responses:
+            mocked_responses.post(WEBHOOK_URL, status=200, repeat=True)
+
+            with self.assertLogs(level="WARNING") as log:
+                async with WebhookDelivery(
+                    WEBHOOK_URL,
+                    batch_interval=0.01,
+                    spill_path=self.spill_path,
+                ):
+                    for _ in range(100):
+                        if not self.spill_path.exists():
+                            break
+                        await asyncio.sleep(0.01)
+
+            calls = next(iter(mocked_responses.requests.values()))
+
+        events = [
+            event
+            for call in calls
+            for event in json.loads(gzip.decompress(call.kwargs["data"]))
+        ]
+        if events != [tip_event(1), tip_event(2)]:
+            msg = "Replayed events mismatch"
+            raise AssertionError(msg)
+        if not any("malformed" in message for message in log.output):
+            msg = "Malformed line was not logged"
+            raise AssertionError(msg)
+
+    async def test_spill_terminates_torn_line(self: "TestWebhookDelivery") -> None:
+        """Test appending after a torn line keeps the new events intact."""
+        self.spill_path.write_text('{"meth', encoding="utf-8")
+        delivery = WebhookDelivery(WEBHOOK_URL, spill_path=self.spill_path)
+
+        delivery._append_spill(json.dumps(tip_event(3)) + "\n")  # noqa: SLF001
+
+        lines = self.spill_path.read_text(encoding="utf-8").splitlines()
+        if lines != ['{"meth', json.dumps(tip_event(3))]:
+            msg = "Torn line was not terminated"
+            raise AssertionError(msg)
+
+
+if __name__ == "__main__":
+    unittest.main()